@@ -7,74 +7,222 @@ import utilities
 import subprocess
 import sys
 import socket
+import selectors
+import ctypes
+import ctypes.util
 import threading
+from collections import deque
+from types import SimpleNamespace
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 # Load config
 config = configparser.ConfigParser()
 config.read('config.ini')
 
+# Resolve every setting once at import time
+CFG = SimpleNamespace(
+    udp_host=config.get('UDP', 'host', fallback='127.0.0.1'),
+    udp_port=config.getint('UDP', 'port', fallback=5005),
+    log_file=config.get('LOGGING', 'filename', fallback='xml.log'),
+    log_format=config.get('LOGGING', 'format', raw=True,
+                          fallback='%(asctime)s - %(levelname)s - %(message)s'),
+    input_folder=os.path.abspath(os.path.normpath(config.get('SETTINGS', 'input_folder', fallback='.'))),
+    output_folder=os.path.abspath(os.path.normpath(config.get('SETTINGS', 'output_folder', fallback='output'))),
+    file_format=config.get('SETTINGS', 'file_format', fallback='*.xml'),
+)
 
-def setup_logging():
-    log_file = config.get('LOGGING', 'filename', fallback='xml.log')
-    log_format = config.get('LOGGING', 'format', raw=True,
-                            fallback='%(asctime)s - %(levelname)s - %(message)s')
 
-    handler = RotatingFileHandler(log_file, maxBytes=1 * 1024 * 1024, backupCount=0)
+def setup_logging():
+    handler = RotatingFileHandler(CFG.log_file, maxBytes=1 * 1024 * 1024, backupCount=0)
     logging.basicConfig(
         handlers=[handler],
         level=logging.INFO,
-        format=log_format
+        format=CFG.log_format
     )
     logging.info("Logging initialized")
-    return log_file
+    return CFG.log_file
 
 
-def udp_listener():
-    udp_ip = config.get('UDP', 'host', fallback='127.0.0.1')
-    udp_port = config.getint('UDP', 'port', fallback=5005)
+# Events replayed to the local listener
+UDP_EVENTS = [
+    "CMD_EXEC_OK: Command A executed successfully",
+    "CMD_EXEC_FAIL: Command B failed due to timeout",
+    "CMD_EXEC_OK: Command C executed successfully"
+]
+UDP_SEND_INTERVAL = 2
+# Intervals the sender may fall behind before it drops the backlog instead of replaying it
+UDP_MAX_CATCH_UP = 3
+UDP_RCVBUF_SIZE = 2 * 1024 * 1024
 
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    sock.bind((udp_ip, udp_port))
 
-    logging.info("Listening for UDP events on {}:{}...".format(udp_ip, udp_port))
+# Batched UDP send via sendmmsg(2); only available on Linux
+class IOVec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p), ('iov_len', ctypes.c_size_t)]
+
+
+class MsgHdr(ctypes.Structure):
+    _fields_ = [('msg_name', ctypes.c_void_p), ('msg_namelen', ctypes.c_uint32),
+                ('msg_iov', ctypes.POINTER(IOVec)), ('msg_iovlen', ctypes.c_size_t),
+                ('msg_control', ctypes.c_void_p), ('msg_controllen', ctypes.c_size_t),
+                ('msg_flags', ctypes.c_int)]
 
-    while True:
-        data, addr = sock.recvfrom(1024)
-        message = data.decode('utf-8')
-        logging.info("Received event: {}".format(message))
-
-        if "CMD_EXEC_OK" in message:
-            logging.info(" Success event detected.")
-        elif "CMD_EXEC_FAIL" in message:
-            logging.warning(" Failure event detected.")
-        else:
-            logging.debug("Unrecognized event format.")
-
-
-def udp_sender():
-    udp_ip = config.get('UDP', 'host', fallback='127.0.0.1')
-    udp_port = config.getint('UDP', 'port', fallback=5005)
-
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    events = [
-        "CMD_EXEC_OK: Command A executed successfully",
-        "CMD_EXEC_FAIL: Command B failed due to timeout",
-        "CMD_EXEC_OK: Command C executed successfully"
-    ]
-    while True:
-        for event in events:
-            sock.sendto(event.encode('utf-8'), (udp_ip, udp_port))
-            logging.info("Sent event: {}".format(event))
 
-            time.sleep(2)
+class MMsgHdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', MsgHdr), ('msg_len', ctypes.c_uint)]
+
+
+def load_sendmmsg():
+    """Returns libc's sendmmsg function, or None where it is not available."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        sendmmsg = libc.sendmmsg
+    except (OSError, AttributeError):
+        return None
+    sendmmsg.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int]
+    sendmmsg.restype = ctypes.c_int
+    return sendmmsg
+
+
+_sendmmsg = load_sendmmsg()
+
+
+def send_batch(sock, payloads):
+    """
+    Sends several datagrams on a connected UDP socket, using one sendmmsg
+    call where available and falling back to one send per datagram.
+
+    Args:
+        sock (socket.socket): Connected UDP socket.
+        payloads (list): Datagram payloads as bytes.
+    """
+    if _sendmmsg is None or len(payloads) < 2:
+        for payload in payloads:
+            sock.send(payload)
+        return
+
+    buffers = [ctypes.create_string_buffer(payload, len(payload)) for payload in payloads]
+    iovecs = (IOVec * len(payloads))()
+    msgs = (MMsgHdr * len(payloads))()
+    for i, buf in enumerate(buffers):
+        iovecs[i].iov_base = ctypes.addressof(buf)
+        iovecs[i].iov_len = len(payloads[i])
+        msgs[i].msg_hdr.msg_iov = ctypes.pointer(iovecs[i])
+        msgs[i].msg_hdr.msg_iovlen = 1
+
+    sent = 0
+    while sent < len(payloads):
+        # sendmmsg may send fewer messages than asked for; resume after them
+        n = _sendmmsg(sock.fileno(), ctypes.addressof(msgs) + sent * ctypes.sizeof(MMsgHdr),
+                      len(payloads) - sent, 0)
+        if n < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        sent += n
+
+
+def handle_udp_message(data):
+    # Only decode the payload when it will actually be logged
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info("Received event: %s", data.decode('utf-8', errors='replace'))
+
+    if b"CMD_EXEC_OK" in data:
+        logging.info(" Success event detected.")
+    elif b"CMD_EXEC_FAIL" in data:
+        logging.warning(" Failure event detected.")
+    else:
+        logging.debug("Unrecognized event format.")
+
+
+def udp_event_loop():
+    """
+    Listens for and sends UDP events from a single thread.
+
+    The receiving socket is polled with a selector; the next send is
+    scheduled as the select timeout, so no second thread is needed.
+    """
+    udp_ip = CFG.udp_host
+    udp_port = CFG.udp_port
+
+    recv_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    # Larger kernel buffer so bursts are not dropped between selects
+    recv_sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_RCVBUF_SIZE)
+    # Allow several listener processes to share the port (not available on Windows)
+    if hasattr(socket, 'SO_REUSEPORT'):
+        recv_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    recv_sock.bind((udp_ip, udp_port))
+    recv_sock.setblocking(False)
+    send_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    send_sock.connect((udp_ip, udp_port))
+
+    sel = selectors.DefaultSelector()
+    sel.register(recv_sock, selectors.EVENT_READ)
+
+    logging.info("Listening for UDP events on %s:%s...", udp_ip, udp_port)
+
+    pending = deque(UDP_EVENTS)
+    next_send = time.monotonic()
+
+    while True:
+        timeout = max(0.0, next_send - time.monotonic())
+        for key, mask in sel.select(timeout):
+            # Drain every datagram that is ready
+            while True:
+                try:
+                    data, addr = key.fileobj.recvfrom(1024)
+                except BlockingIOError:
+                    break
+                handle_udp_message(data)
+
+        # Send every event that has come due, in one batch if the loop fell behind
+        due = []
+        now = time.monotonic()
+        if now - next_send > UDP_MAX_CATCH_UP * UDP_SEND_INTERVAL:
+            # Stalled for a long time; restart the schedule rather than flood stale events
+            next_send = now
+        while now >= next_send:
+            event = pending.popleft()
+            pending.append(event)
+            due.append(event)
+            next_send += UDP_SEND_INTERVAL
+        if due:
+            send_batch(send_sock, [event.encode('utf-8') for event in due])
+            for event in due:
+                logging.info("Sent event: %s", event)
+
+
+def convert_one(file, output_folder):
+    """
+    Converts a single XML file to XAML. Runs inside a worker process, so it
+    does not log; logging is only configured in the parent.
+
+    Args:
+        file (str): Path to the XML file.
+        output_folder (str): Existing folder where the XAML file is written.
+
+    Returns:
+        tuple: Input file, output file path, whether any shapes were written,
+        and the XML and XAML items collected for validation.
+    """
+    canvas_elements, xml_items, xaml_items = utilities.parse_xml(file)
+    output_file = os.path.join(output_folder, os.path.basename(file).replace(".xml", ".xaml"))
+
+    if not canvas_elements:
+        return file, output_file, False, xml_items, xaml_items
+
+    utilities.write_xaml(output_file, canvas_elements)
+
+    return file, output_file, True, xml_items, xaml_items
 
 
 def main_program(log_file):
     start_time = time.time()
 
-    input_folder = os.path.abspath(os.path.normpath(config.get('SETTINGS', 'input_folder', fallback='.')))
-    output_folder = os.path.abspath(os.path.normpath(config.get('SETTINGS', 'output_folder', fallback='output')))
-    file_format = config.get('SETTINGS', 'file_format', fallback='*.xml')
+    input_folder = CFG.input_folder
+    output_folder = CFG.output_folder
+    file_format = CFG.file_format
 
     logging.info('Configuration loaded. Input folder: %s, Output folder: %s, File format: %s',
                  input_folder, output_folder, file_format)
@@ -91,26 +239,30 @@ def main_program(log_file):
         print(file)
 
     print("\nOutput Files:")
-    for file in files:
-        logging.info('Processing file: %s', file)
-        canvas_elements = utilities.parse_xml(file)
-
-        if canvas_elements:
-            output_file = os.path.join(output_folder, os.path.basename(file).replace(".xml", ".xaml"))
-            os.makedirs(os.path.dirname(output_file), exist_ok=True)
-
-            with open(output_file, "w") as f:
-                f.write("\n".join(canvas_elements))
-
-            logging.info('File saved to %s', output_file)
-            print("Saved to {}".format(output_file))
-
-        else:
-            logging.warning('No shapes found in %s', file)
-            print("No shapes found in {}".format(file))
+    os.makedirs(output_folder, exist_ok=True)
+    # XML and XAML items per file, reused by validation instead of re-parsing
+    cached_xml_items = {}
+    cached_xaml_items = {}
+    # No more workers than files; Windows also rejects pools larger than 61
+    max_workers = min(len(files), os.cpu_count() or 1)
+    if sys.platform == 'win32':
+        max_workers = min(max_workers, 61)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for file, output_file, ok, xml_items, xaml_items in executor.map(
+                partial(convert_one, output_folder=output_folder), files):
+            logging.info('Converted file: %s', file)
+            cached_xml_items[file] = xml_items
+            if ok:
+                cached_xaml_items[file] = xaml_items
+                logging.info('File saved to %s', output_file)
+                print("Saved to {}".format(output_file))
+            else:
+                logging.warning('No shapes found in %s', file)
+                print("No shapes found in {}".format(file))
 
     print("\nValidating generated files...")
-    utilities.validate_conversion_all(input_folder, output_folder, file_format)
+    utilities.validate_conversion_all(input_folder, output_folder, file_format,
+                                      xml_items=cached_xml_items, xaml_items=cached_xaml_items)
 
     end_time = time.time()
     print("\nExecution Time: {:.2f} seconds".format(end_time - start_time))
@@ -124,12 +276,8 @@ def launch_comparison_script():
 if __name__ == "__main__":
     log_file = setup_logging()
 
-    # Start UDP listener in background thread
-    listener_thread = threading.Thread(target=udp_listener, daemon=True)
-    listener_thread.start()
-
-    # Start UDP sender in background thread
-    sender_thread = threading.Thread(target=udp_sender, daemon=True)
-    sender_thread.start()
+    # Start UDP listener and sender in one background thread
+    udp_thread = threading.Thread(target=udp_event_loop, daemon=True)
+    udp_thread.start()
 
     main_program(log_file)
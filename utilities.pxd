@@ -0,0 +1,15 @@
+# Optional Cython declarations for utilities.py (pure Python mode).
+# Build in place with:  cythonize -i -3 utilities.py
+# Without a build, utilities.py runs unchanged as plain Python.
+
+cimport cython
+
+@cython.locals(left=cython.long, right=cython.long, top=cython.long, bottom=cython.long,
+               width=cython.long, height=cython.long)
+cpdef emit_rect(shape, dict ctx, long counter, str shape_key, str visibility)
+
+@cython.locals(left=cython.long, right=cython.long, top=cython.long, bottom=cython.long)
+cpdef emit_textbox(shape, dict ctx, long counter, str shape_key, str visibility)
+
+@cython.locals(xs=list, ys=list)
+cpdef emit_polygon(shape, dict ctx, long counter, str shape_key, str visibility)
@@ -1,13 +1,64 @@
 import os
-import glob
-import xml.etree.ElementTree as ET
+import mmap
+import codecs
 import configparser
 import logging
+from contextlib import contextmanager
+from functools import lru_cache
+
+# Prefer lxml (libxml2) for parsing speed, fall back to the standard library
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+
+def compile_path(path):
+    """
+    Compiles an XPath expression once so it can be reused for every element.
+
+    Args:
+        path (str): Relative XPath, optionally ending in '/text()'.
+
+    Returns:
+        callable: Takes an element and returns a list of matches.
+    """
+    if HAS_LXML:
+        return ET.XPath(path)
+
+    # ElementTree has no XPath object; emulate it with findall
+    if path.endswith('/text()'):
+        elem_path = path[:-len('/text()')]
+        return lambda elem: [e.text for e in elem.findall(elem_path) if e.text]
+    return lambda elem: elem.findall(path)
+
+
+def first(matches, default=None):
+    """
+    Returns the first result of a compiled path, or default if there is none.
+    """
+    return matches[0] if matches else default
+
+
+# Paths used for every shape, compiled once per run
+_XP_CLASSNAME = compile_path('./MetaData/ClassName/text()')
+_XP_PEN_COLOR = compile_path('./Pen/Color/text()')
+_XP_FILL_COLOR = compile_path('./FillColor/Color/text()')
+_XP_STROKE_THICKNESS = compile_path('./Style/StrokeThickness/text()')
+_XP_LINE_COLOR = compile_path('./ShapeStyle/LineColor/text()')
+_XP_STYLE_FILL_COLOR = compile_path('./ShapeStyle/FillColor/text()')
+_XP_RECT = compile_path('./RectShape')
+_XP_TXTBOX_RECT = compile_path('./Rectangle/RectShape')
+_XP_PTS_X = compile_path('./PolyShape/Points/Point/X/text()')
+_XP_PTS_Y = compile_path('./PolyShape/Points/Point/Y/text()')
+_XP_SHAPE = compile_path('./SHAPE')
+_XP_SHAPES = compile_path('./SHAPEARRAY/ShapeObject')
+
+# Default gray used when a color is missing or invalid
+DEFAULT_COLOR = "#808080"
 
-# Dictionaries to store extracted data
-parent_dict = {}
-shape_dict = {}
-crule_dict = {}
 
 def load_config(config_path):
     """
@@ -78,11 +129,40 @@ def get_files(input_folder, file_format):
     Returns:
         list: List of file paths.
     """
-    # Create file search pattern
-    file_pattern = os.path.join(input_folder, f"*.{file_format}")
-    return glob.glob(file_pattern)
+    # Match on the file suffix directly instead of a glob pattern;
+    # normcase keeps glob's case-insensitive matching on Windows
+    suffix = os.path.normcase("." + file_format.lstrip('*.'))
+    try:
+        with os.scandir(input_folder) as entries:
+            return [os.path.join(input_folder, entry.name) for entry in entries
+                    if os.path.normcase(entry.name).endswith(suffix)
+                    and not entry.name.startswith('.') and entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        # Missing input folder: no files, as glob reported it
+        return []
+
+
+def write_xaml(output_file, canvas_elements):
+    """
+    Writes the encoded XAML straight to the file descriptor with os.write,
+    bypassing Python's buffered text layer.
 
+    Args:
+        output_file (str): Path to the XAML file.
+        canvas_elements (list): XAML element strings.
+    """
+    data = memoryview("\n".join(canvas_elements).encode('utf-8'))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(output_file, flags, 0o644)
+    try:
+        # os.write may write less than asked for on very large buffers
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
+
+@lru_cache(maxsize=None)
 def decimal_to_hex(color_val):
     """
     Converts a decimal color value to a hex string.
@@ -95,24 +175,11 @@ def decimal_to_hex(color_val):
     """
     # Default gray color if color_val is None or invalid
     if not color_val:
-        return "#808080"
+        return DEFAULT_COLOR
     try:
         return "#{:06X}".format(int(color_val))
     except ValueError:
-        return "#808080"
-
-
-def has_crule(shape_obj):
-    """
-    Checks if a shape object has a RULE element.
-
-    Args:
-        shape_obj (xml.Element): Shape object element.
-
-    Returns:
-        bool: True if RULE element is found, False otherwise.
-    """
-    return shape_obj.find('RULE') is not None
+        return DEFAULT_COLOR
 
 
 def extract_children_text(elem):
@@ -128,6 +195,9 @@ def extract_children_text(elem):
     data = {}
     # Loop through child elements
     for child in elem:
+        # Skip comments and processing instructions (lxml keeps them in the tree)
+        if not isinstance(child.tag, str):
+            continue
         # Check if child has sub-elements
         if list(child):
             for subchild in child:
@@ -162,33 +232,249 @@ def extract_visuals(shape):
     Returns:
         tuple: Stroke color, stroke thickness, and fill color.
     """
-    stroke = fill = stroke_thickness = None
+    stroke = fill = None
 
     # Extract Pen details
-    pen = shape.find('Pen')
-    if pen is not None:
-        stroke = decimal_to_hex(pen.findtext('Color'))
+    pen_color = first(_XP_PEN_COLOR(shape))
+    if pen_color is not None:
+        stroke = decimal_to_hex(pen_color)
 
     # Extract FillColor details
-    fill_color = shape.find('FillColor')
+    fill_color = first(_XP_FILL_COLOR(shape))
     if fill_color is not None:
-        fill = decimal_to_hex(fill_color.findtext('Color'))
+        fill = decimal_to_hex(fill_color)
 
     # Extract Style details
-    style = shape.find('Style')
-    if style is not None:
-        stroke_thickness = style.findtext('StrokeThickness')
-
-    # Extract ShapeStyle details
-    shape_style = shape.find('ShapeStyle')
-    if shape_style is not None:
-        if not stroke:
-            stroke = decimal_to_hex(shape_style.findtext('LineColor'))
-        if not fill:
-            fill = decimal_to_hex(shape_style.findtext('FillColor'))
+    stroke_thickness = first(_XP_STROKE_THICKNESS(shape))
+
+    # Fall back to ShapeStyle details
+    if not stroke:
+        line_color = first(_XP_LINE_COLOR(shape))
+        if line_color is not None:
+            stroke = decimal_to_hex(line_color)
+    if not fill:
+        style_fill = first(_XP_STYLE_FILL_COLOR(shape))
+        if style_fill is not None:
+            fill = decimal_to_hex(style_fill)
 
     # Default values if not set
-    return stroke or "#808080", stroke_thickness or "1", fill or "#808080"
+    return stroke or DEFAULT_COLOR, stroke_thickness or "1", fill or DEFAULT_COLOR
+
+
+@contextmanager
+def open_mapped(file_path):
+    """
+    Opens a file as a read-only memory map, so the kernel pages it in on demand.
+
+    Args:
+        file_path (str): Path to the file.
+
+    Yields:
+        mmap.mmap object, or the open binary file if it is empty (empty files cannot be mapped).
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield f
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def release_element(elem):
+    """
+    Frees an element that has already been processed during iterparse.
+
+    Args:
+        elem (xml.Element): Fully processed element.
+    """
+    elem.clear()
+    # lxml keeps references to earlier siblings; drop them as well
+    if HAS_LXML:
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def collect_xml_items(elem, xml_tags, xml_values):
+    """
+    Records an element's tag and attribute values for validate_conversion.
+
+    Args:
+        elem (xml.Element): XML element.
+        xml_tags (dict): Tags seen so far, in first-seen document order.
+        xml_values (dict): Attribute values seen so far, mapped to the (tag, attribute)
+            of the first element in document order that has them.
+    """
+    # lxml also yields comments and processing instructions, whose tag is not a str
+    if not isinstance(elem.tag, str) or elem.tag.lower() == 'root':
+        return
+    xml_tags.setdefault(elem.tag, None)
+    for attr, value in elem.attrib.items():
+        xml_values.setdefault(str(value), (elem.tag, attr))
+
+
+# ---------- Shape Handlers ----------
+def emit_rect(shape, ctx, counter, shape_key, visibility):
+    """
+    Emits a CRectangle shape as a XAML Rectangle.
+
+    Args:
+        shape (xml.Element): SHAPE element.
+        ctx (dict): Name prefixes and outputs of the current ViewObject.
+        counter (int): Running shape number used in the element name.
+        shape_key (str): Key of the shape in shape_dict.
+        visibility (str): XAML Visibility value.
+    """
+    # Extract visual properties (stroke, thickness, fill)
+    stroke, stroke_thickness, fill = extract_visuals(shape)
+
+    # Extract RectShape data
+    rect = first(_XP_RECT(shape))
+    left = int(rect.findtext('Left'))
+    right = int(rect.findtext('Right'))
+    top = int(rect.findtext('Top'))
+    bottom = int(rect.findtext('Bottom'))
+
+    # Calculate width and height
+    width = right - left
+    height = bottom - top
+
+    rect_name = ctx['rect_name']
+    # Update shape_dict with rectangle data
+    ctx['shape_dict'][shape_key] = {
+        'ClassName': rect_name,
+        'Visibility': visibility,
+        'Tag': '1',
+        'Left': left,
+        'Top': top,
+        'Width': width,
+        'Height': height,
+        'Stroke': stroke,
+        'StrokeThickness': stroke_thickness,
+        'Fill': fill
+    }
+
+    # Record the emitted tag and attribute values for validation
+    name = f"{rect_name}-{counter}"
+    ctx['xaml_tags'].add('Rectangle')
+    ctx['xaml_values'].update((name, str(width), str(height), str(left), str(top), stroke,
+                               stroke_thickness, fill, '1', visibility, '2'))
+
+    # Append rectangle XAML element
+    ctx['canvas_elements'].append(
+        f'<Rectangle Name="{name}" Width="{width}" Height="{height}" '
+        f'Canvas.Left="{left}" Canvas.Top="{top}" Stroke="{stroke}" StrokeThickness="{stroke_thickness}" '
+        f'Fill="{fill}" Tag="1" Visibility="{visibility}" Canvas.ZIndex="2"/>'
+    )
+
+
+def emit_textbox(shape, ctx, counter, shape_key, visibility):
+    """
+    Emits a CTextBox shape as a XAML TextBlock. Arguments as for emit_rect.
+    """
+    # Extract RectShape data for the text box
+    rect = first(_XP_TXTBOX_RECT(shape))
+    left = int(rect.findtext('Left'))
+    right = int(rect.findtext('Right'))
+    top = int(rect.findtext('Top'))
+    bottom = int(rect.findtext('Bottom'))
+
+    txt_name = ctx['txt_name']
+    # Update shape_dict with text box data
+    ctx['shape_dict'][shape_key] = {
+        'ClassName': txt_name,
+        'Visibility': visibility,
+        'Tag': '1',
+        'Left': left,
+        'Top': top,
+        'Right': right,
+        'Bottom': bottom,
+        'Text': 'control'
+    }
+
+    # Record the emitted tag and attribute values for validation
+    name = f"{txt_name}-{counter}"
+    ctx['xaml_tags'].add('TextBlock')
+    ctx['xaml_values'].update((name, 'control', str(left), str(top), str(right), str(bottom),
+                               DEFAULT_COLOR, '10', 'Normal', '1', visibility))
+
+    # Append text box XAML element
+    ctx['canvas_elements'].append(
+        f'<TextBlock Name="{name}" Text="control" '
+        f'Canvas.Left="{left}" Canvas.Top="{top}" Canvas.Right="{right}" Canvas.Bottom="{bottom}" '
+        f'Foreground="#808080" FontSize="10" FontWeight="Normal" Tag="1" Visibility="{visibility}"/>'
+    )
+
+
+def emit_polygon(shape, ctx, counter, shape_key, visibility):
+    """
+    Emits a CPolygon or CParallelogram shape as a XAML Polygon. Arguments as for emit_rect.
+    """
+    # Extract visual properties (stroke, thickness, fill)
+    stroke, stroke_thickness, fill = extract_visuals(shape)
+
+    # Extract all point coordinates for the polygon or parallelogram
+    xs = [int(x) for x in _XP_PTS_X(shape)]
+    ys = [int(y) for y in _XP_PTS_Y(shape)]
+    points_str = " ".join([f"{x},{y}" for x, y in zip(xs, ys)])
+
+    poly_name = ctx['poly_name']
+    # Update shape_dict with polygon data
+    ctx['shape_dict'][shape_key] = {
+        'ClassName': poly_name,
+        'Visibility': visibility,
+        'Tag': '17',
+        'Points': points_str,
+        'Stroke': stroke,
+        'StrokeThickness': stroke_thickness,
+        'Fill': fill
+    }
+
+    # Record the emitted tag and attribute values for validation
+    name = f"{poly_name}-{counter}"
+    ctx['xaml_tags'].add('Polygon')
+    ctx['xaml_values'].update((name, points_str, stroke, stroke_thickness, fill, '17', visibility, '2'))
+
+    # Append polygon XAML element
+    ctx['canvas_elements'].append(
+        f'<Polygon Name="{name}" Points="{points_str}" '
+        f'Stroke="{stroke}" StrokeThickness="{stroke_thickness}" Fill="{fill}" '
+        f'Tag="17" Visibility="{visibility}" Canvas.ZIndex="2"/>'
+    )
+
+
+# Maps a SHAPE class name to the function that emits its XAML
+SHAPE_HANDLERS = {
+    'CRectangle': emit_rect,
+    'CTextBox': emit_textbox,
+    'CPolygon': emit_polygon,
+    'CParallelogram': emit_polygon
+}
+
+
+def iter_viewobjects(xml_file, xml_tags, xml_values):
+    """
+    Streams the ViewObjects of a memory-mapped XML file, freeing each one
+    after it has been handled.
+
+    Args:
+        xml_file (str): Path to the XML file.
+        xml_tags (dict): Filled with the tags seen, see collect_xml_items.
+        xml_values (dict): Filled with the attribute values seen.
+
+    Yields:
+        xml.Element: Each fully parsed ViewObject element.
+    """
+    with open_mapped(xml_file) as source:
+        for event, elem in ET.iterparse(source, events=('start', 'end')):
+            # Collect on start events so items come in document order, as root.iter() gives
+            if event == 'start':
+                collect_xml_items(elem, xml_tags, xml_values)
+                continue
+            if elem.tag != 'ViewObject':
+                continue
+            yield elem
+            # Free the processed ViewObject so memory stays bounded
+            release_element(elem)
 
 
 # ---------- Parse Function ----------
@@ -200,226 +486,77 @@ def parse_xml(xml_file):
         xml_file (str): Path to the XML file.
 
     Returns:
-        tuple: A list of XAML canvas elements, canvas width, and canvas height.
+        tuple: A list of XAML canvas elements, the (tags, values) found in the
+        XML, and the (tags, values) emitted to XAML, so validate_conversion
+        does not need to parse either file again.
     """
-    global parent_dict, shape_dict, crule_dict
-
-    # Parse the XML file
-    tree = ET.parse(xml_file)
-    root = tree.getroot()
     counter=0
+    xml_tags = {}
+    xml_values = {}
+    xaml_tags = set()
+    xaml_values = set()
 
-    # Initialize canvas elements and boundary coordinates
+    # Initialize canvas elements
     canvas_elements = []
-    min_x = None
-    max_x = None
-    min_y = None
-    max_y = None
-
-    # Iterate through each ViewObject in the XML
-    for viewobject in root.findall('.//ViewObject'):
-        # Clear dictionaries for each ViewObject
-        parent_dict.clear()
-        shape_dict.clear()
-        crule_dict.clear()
-
-        # Extract and update parent_dict with data from the ViewObject
-        parent_dict.update(extract_children_text(viewobject))
+
+    # Stream through the XML, handling each ViewObject once it is fully parsed
+    for viewobject in iter_viewobjects(xml_file, xml_tags, xml_values):
+        # Fresh dictionaries for each ViewObject
+        parent_dict = extract_children_text(viewobject)
+        shape_dict = {}
+        crule_dict = {}
         symbol_key = parent_dict.get('SymbolKey', '0')
         sysname = parent_dict.get('SysName', 'default')
 
-        # Locate SHAPEARRAY containing shape objects
-        shape_array = viewobject.find('SHAPEARRAY')
-        if shape_array is None:
-            continue  # Skip if no SHAPEARRAY found
+        # Name prefixes and outputs shared by every shape in this ViewObject
+        ctx = {
+            'rect_name': "{}-rect-{}".format(sysname, symbol_key),
+            'txt_name': "{}-txt-{}".format(sysname, symbol_key),
+            'poly_name': "{}-poly-{}".format(sysname, symbol_key),
+            'shape_dict': shape_dict,
+            'canvas_elements': canvas_elements,
+            'xaml_tags': xaml_tags,
+            'xaml_values': xaml_values
+        }
 
         # Iterate through each ShapeObject in the SHAPEARRAY
-        for idx, shapeobject in enumerate(shape_array.findall('.//ShapeObject')):
+        for idx, shapeobject in enumerate(_XP_SHAPES(viewobject)):
             # Locate SHAPE element
-            shape = shapeobject.find('.//SHAPE')
+            shape = first(_XP_SHAPE(shapeobject))
             if shape is None:
                 continue
 
             # Extract the class name (CRectangle, CTextBox, etc.)
-            classname = shape.find('./MetaData/ClassName').text
+            classname = first(_XP_CLASSNAME(shape))
 
             # Check if the shape has a RULE element
-            rule_present = has_crule(shapeobject)
+            crule_elem = shapeobject.find('RULE')
+            rule_present = crule_elem is not None
             # Determine visibility based on the presence of RULE
             visibility = "Collapsed" if rule_present else "Visible"
 
             # Construct a unique shape key
             shape_key = 'shape_{}'.format(idx)
 
-            # Extract visual properties (stroke, thickness, fill)
-            stroke, stroke_thickness, fill = extract_visuals(shape)
-
             # Extract rule data if a RULE element is present
             if rule_present:
-                crule_elem = shapeobject.find('RULE')
                 crule_dict.update(extract_rule_details(crule_elem))
 
-            # Handle CRectangle shapes
-            if classname == 'CRectangle':
-                # Extract RectShape data
+            # Dispatch on the class name; unsupported shapes are skipped
+            handler = SHAPE_HANDLERS.get(classname)
+            if handler is not None:
                 counter+=1
-                rect = shape.find('RectShape')
-                left = int(rect.findtext('Left'))
-                right = int(rect.findtext('Right'))
-                top = int(rect.findtext('Top'))
-                bottom = int(rect.findtext('Bottom'))
-
-
-                # Calculate width and height
-                width = right - left
-                height = bottom - top
-
-                # Update min and max coordinates for canvas size calculation
-                min_x = left if min_x is None else min(min_x, left)
-                max_x = right if max_x is None else max(max_x, right)
-                min_y = top if min_y is None else min(min_y, top)
-                max_y = bottom if max_y is None else max(max_y, bottom)
-
-                # Update shape_dict with rectangle data
-                shape_dict[shape_key] = {
-                    'ClassName': "{}-rect-{}".format(sysname, symbol_key),
-                    'Visibility': visibility,
-                    'Tag': '1',
-                    'Left': left,
-                    'Top': top,
-                    'Width': width,
-                    'Height': height,
-                    'Stroke': stroke,
-                    'StrokeThickness': stroke_thickness,
-                    'Fill': fill
-
-                }
-
-                # Append rectangle XAML element
-                canvas_elements.append(
-                    '<Rectangle Name="{sysname}-rect-{symbol_key}-{counter}" Width="{width}" Height="{height}" '
-                    'Canvas.Left="{left}" Canvas.Top="{top}" Stroke="{stroke}" StrokeThickness="{stroke_thickness}" '
-                    'Fill="{fill}" Tag="1" Visibility="{visibility}" Canvas.ZIndex="2"/>'.format(
-                        sysname=sysname,
-                        symbol_key=symbol_key,
-                        counter=counter,
-                        width=width,
-                        height=height,
-                        left=left,
-                        top=top,
-                        stroke=stroke,
-                        stroke_thickness=stroke_thickness,
-                        fill=fill,
-                        visibility=visibility
-                    )
-                )
-
-            # Handle CTextBox shapes
-            elif classname == 'CTextBox':
-                # Extract RectShape data for the text box
-                counter+=1
-                rect = shape.find('Rectangle/RectShape')
-                left = int(rect.findtext('Left'))
-                right = int(rect.findtext('Right'))
-                top = int(rect.findtext('Top'))
-                bottom = int(rect.findtext('Bottom'))
-
-                # Update min and max coordinates for canvas size calculation
-                min_x = left if min_x is None else min(min_x, left)
-                max_x = right if max_x is None else max(max_x, right)
-                min_y = top if min_y is None else min(min_y, top)
-                max_y = bottom if max_y is None else max(max_y, bottom)
-
-                # Update shape_dict with text box data
-                shape_dict[shape_key] = {
-                    'ClassName': "{}-txt-{}".format(sysname, symbol_key),
-                    'Visibility': visibility,
-                    'Tag': '1',
-                    'Left': left,
-                    'Top': top,
-                    'Right': right,
-                    'Bottom': bottom,
-                    'Text': 'control'
-                }
-
-                # Append text box XAML element
-                canvas_elements.append(
-                    '<TextBlock Name="{sysname}-txt-{symbol_key}-{counter}" Text="control" '
-                    'Canvas.Left="{left}" Canvas.Top="{top}" Canvas.Right="{right}" Canvas.Bottom="{bottom}" '
-                    'Foreground="#808080" FontSize="10" FontWeight="Normal" Tag="1" Visibility="{visibility}"/>'.format(
-                        sysname=sysname,
-                        symbol_key=symbol_key,
-                        counter=counter,
-                        left=left,
-                        top=top,
-                        right=right,
-                        bottom=bottom,
-                        visibility=visibility
-                    )
-                )
-
-            # Handle CPolygon and CParallelogram shapes
-            elif classname in ['CPolygon', 'CParallelogram']:
-                counter+=1
-                points = []
-
-                # Extract all points for the polygon or parallelogram
-                for pt in shape.findall('PolyShape/Point'):
-                    x = int(pt.findtext('X'))
-                    y = int(pt.findtext('Y'))
-                    points.append(f"{x},{y}")
-
-                    # Update min and max coordinates for canvas size calculation
-                    min_x = x if min_x is None else min(min_x, x)
-                    max_x = x if max_x is None else max(max_x, x)
-                    min_y = y if min_y is None else min(min_y, y)
-                    max_y = y if max_y is None else max(max_y, y)
-
-                # Update shape_dict with polygon data
-                shape_dict[shape_key] = {
-                    'ClassName': "{}-poly-{}".format(sysname, symbol_key),
-                    'Visibility': visibility,
-                    'Tag': '17',
-                    'Points': " ".join(points),
-                    'Stroke': stroke,
-                    'StrokeThickness': stroke_thickness,
-                    'Fill': fill
-                }
-
-                # Append polygon XAML element
-                canvas_elements.append(
-                    '<Polygon Name="{sysname}-poly-{symbol_key}-{counter}" Points="{points}" '
-                    'Stroke="{stroke}" StrokeThickness="{stroke_thickness}" Fill="{fill}" '
-                    'Tag="17" Visibility="{visibility}" Canvas.ZIndex="2"/>'.format(
-                        sysname=sysname,
-                        symbol_key=symbol_key,
-                        counter=counter,
-                        points=" ".join(points),
-                        stroke=stroke,
-                        stroke_thickness=stroke_thickness,
-                        fill=fill,
-                        visibility=visibility
-                    )
-                )
-
-        # Determine canvas size based on min and max coordinates
-        if min_x is not None and max_x is not None and min_y is not None and max_y is not None:
-            canvas_width = max_x - min_x
-            canvas_height = max_y - min_y
-        else:
-            # Default canvas size if no shapes found
-            canvas_width = 800
-            canvas_height = 600
+                handler(shape, ctx, counter, shape_key, visibility)
 
-    # Return the generated XAML elements and canvas size
-    return canvas_elements
+    # Return the generated XAML elements and the XML/XAML items for validation
+    return canvas_elements, (xml_tags, xml_values), (xaml_tags, xaml_values)
 
-def validate_conversion_all(input_folder, output_folder, file_format="xml"):
+def validate_conversion_all(input_folder, output_folder, file_format="xml", xml_items=None, xaml_items=None):
     # Ensure we’re building a valid glob pattern like *.xml
     pattern = "*.{}".format(file_format.lstrip('*.'))
     search_path = os.path.join(input_folder, pattern)
     print("DEBUG: Searching for XML files to validate in: {}".format(search_path))
-    xml_files = glob.glob(search_path)
+    xml_files = get_files(input_folder, file_format)
     print("DEBUG: Found XML files: {}".format(xml_files))
 
     if not xml_files:
@@ -433,46 +570,46 @@ def validate_conversion_all(input_folder, output_folder, file_format="xml"):
         if not os.path.exists(xaml_file):
             print(" Warning: Output file for {} not found: {}".format(base_name, xaml_file))
             continue
-        validate_conversion(xml_file, xaml_file)
+        validate_conversion(xml_file, xaml_file,
+                            xml_items.get(xml_file) if xml_items else None,
+                            xaml_items.get(xml_file) if xaml_items else None)
 
-def validate_conversion(xml_file, xaml_file):
-    """Validate if all elements and attributes in XML are present in XAML."""
+def validate_conversion(xml_file, xaml_file, xml_items=None, xaml_items=None):
+    """
+    Validate if all elements and attributes in XML are present in XAML.
+    xml_items and xaml_items are the (tags, values) pairs returned by
+    parse_xml; when given, the matching file is not parsed again.
+    """
     try:
         print("\n🔍 Validating: {} ↔ {}".format(xml_file, xaml_file))
 
-        # Parse XML and XAML files
-        tree = ET.parse(xml_file)
-        root = tree.getroot()
-
-        xaml_tree = ET.parse(xaml_file)
-        xaml_root = xaml_tree.getroot()
+        # Gather unique tags and attribute values from XML, keeping first-seen document order
+        if xml_items is not None:
+            xml_tags, xml_values = xml_items
+        else:
+            xml_tags = {}
+            xml_values = {}
+            for elem in ET.parse(xml_file).getroot().iter():
+                collect_xml_items(elem, xml_tags, xml_values)
 
         # Gather all tags and attribute values from XAML
-        xaml_tags = set()
-        xaml_attributes = set()
-        for x_elem in xaml_root.iter():
-            xaml_tags.add(x_elem.tag)
-            for attr_val in x_elem.attrib.values():
-                xaml_attributes.add(str(attr_val))
-
-        mismatches = []
-
-        # Loop through XML elements
-        for i, elem in enumerate(root.iter()):
-            if elem.tag.lower() == 'root':
-                continue
-
-            if i % 100 == 0 and i > 0:
-                print("  ...Checked {} elements".format(i))
+        if xaml_items is not None:
+            xaml_tags, xaml_attributes = xaml_items
+        else:
+            xaml_tree = ET.parse(xaml_file)
+            xaml_root = xaml_tree.getroot()
 
-            # Check tag existence
-            if elem.tag not in xaml_tags:
-                mismatches.append("Missing tag: {}".format(elem.tag))
+            xaml_tags = set()
+            xaml_attributes = set()
+            for x_elem in xaml_root.iter():
+                xaml_tags.add(x_elem.tag)
+                for attr_val in x_elem.attrib.values():
+                    xaml_attributes.add(str(attr_val))
 
-            # Check attribute values
-            for attr, value in elem.attrib.items():
-                if str(value) not in xaml_attributes:
-                    mismatches.append("{} - Missing value: {}={}".format(elem.tag, attr, value))
+        # Only the differences need to be reported
+        mismatches = ["Missing tag: {}".format(tag) for tag in xml_tags if tag not in xaml_tags]
+        mismatches.extend("{} - Missing value: {}={}".format(tag, attr, value)
+                          for value, (tag, attr) in xml_values.items() if value not in xaml_attributes)
 
         # Final result output
         if mismatches:
@@ -503,8 +640,23 @@ def parse_xml_with_dummy_root(file_path):
     Parse XML or XAML file with multiple root elements.
     Removes BOM and any content before the XML declaration.
     Wraps content in a dummy root element.
+    With lxml, a recovering parser is used: the XML declaration, now inside
+    the dummy root, becomes a processing instruction child, and malformed
+    markup is skipped rather than reported.
     """
     try:
+        if HAS_LXML:
+            # Wrap the raw bytes directly; no decode/encode round trip is needed
+            with open_mapped(file_path) as source:
+                content = source.read()
+            if content.startswith(codecs.BOM_UTF8):
+                content = content[len(codecs.BOM_UTF8):]
+            # Remove anything before the XML declaration, as the fallback below does
+            xml_decl_index = content.find(b'<?xml')
+            content = content.lstrip() if xml_decl_index == -1 else content[xml_decl_index:]
+            parser = ET.XMLParser(huge_tree=True, recover=True)
+            return ET.fromstring(b"<DummyRoot>\n" + content + b"\n</DummyRoot>", parser=parser)
+
         with open(file_path, 'r', encoding='utf-8-sig') as f:
             content = f.read()
 